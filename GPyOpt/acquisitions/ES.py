@@ -65,9 +65,9 @@ class AcquisitionEntropySearch(AcquisitionBase):
                 if len(x.shape) != 1:
                     raise ValueError("Expected a vector, received a matrix of shape {}".format(x.shape))
                 if np.all(np.all(mi <= x)) and np.all(np.all(x <= ma)):
-                    return np.log(np.clip(ei._compute_acq(x), 0., np.PINF))
+                    return np.log(np.clip(ei._compute_acq(x), 0., np.inf))
                 else:
-                    return np.NINF
+                    return -np.inf
 
             self.proposal_function = prop_func
 
@@ -5,7 +5,7 @@ from .base import AcquisitionBase
 from .LCB import AcquisitionLCB
 from .LCB_mcmc import AcquisitionLCB_MCMC
 import numpy as np
-from scipy.stats import norm
+from scipy.special import log_ndtr, ndtr
 
 class AcquisitionLP(AcquisitionBase):
     """
@@ -51,8 +51,8 @@ class AcquisitionLP(AcquisitionBase):
         """
         if x0 is None: return None, None
         if len(x0.shape)==1: x0 = x0[None,:]
-        m = model.predict(x0)[0]
-        pred = model.predict(x0)[1].copy()
+        m, pred = model.predict(x0)
+        pred = pred.copy()
         pred[pred<1e-16] = 1e-16
         s = np.sqrt(pred)
         r_x0 = (m-Min)/L
@@ -65,7 +65,7 @@ class AcquisitionLP(AcquisitionBase):
         '''
         Creates the function to define the exclusion zones
         '''
-        return norm.logcdf((np.sqrt((np.square(np.atleast_2d(x)[:,None,:]-np.atleast_2d(x0)[None,:,:])).sum(-1))- r_x0)/s_x0)
+        return log_ndtr((np.sqrt((np.square(np.atleast_2d(x)[:,None,:]-np.atleast_2d(x0)[None,:,:])).sum(-1))- r_x0)/s_x0)
 
     def _penalized_acquisition(self, x,  model, X_batch, r_x0, s_x0):
         '''
@@ -90,16 +90,17 @@ class AcquisitionLP(AcquisitionBase):
 
     def _d_hammer_function(self, x, X_batch, r_x0, s_x0):
         """
-        Computes the value of the penalizer (centered at x_0) at any x.
+        Computes the gradient of the log-penalizers (centered at the points of X_batch) at any x, summed over the batch.
+        By the chain rule, the gradient of log(h(z)) with z = (|x-x0|-r_x0)/s_x0 is phi(z)/(s_x0*h(z)) * (x-x0)/|x-x0|.
         """
         dx = np.atleast_2d(x)[:,None,:]-np.atleast_2d(X_batch)[None,:,:]
         nm = np.sqrt((np.square(dx)).sum(-1))
         z = (nm- r_x0)/s_x0
-        h_func = norm.cdf(z)
+        h_func = ndtr(z)
 
         d = 1./(s_x0*np.sqrt(2*np.pi)*h_func)*np.exp(-np.square(z)/2)/nm
         d[h_func<1e-50] = 0.
-        d = d[:,:,None]
+        d = d[:,:,None]*dx
         return d.sum(axis=1)
 
     def acquisition_function(self, x):
@@ -120,7 +121,7 @@ class AcquisitionLP(AcquisitionBase):
             scale = 1./(np.log1p(np.exp(fval))*(1.+np.exp(-fval)))
         elif self.transform=='none':
             fval = -self.acq.acquisition_function(x)[:,0]
-            scale = 1./fval
+            scale = 1./(fval+1e-50)
         else:
             scale = 1.
 
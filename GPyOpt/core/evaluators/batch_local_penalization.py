@@ -2,7 +2,6 @@
 # Licensed under the BSD 3-clause license (see LICENSE.txt)
 
 from .base import EvaluatorBase
-import scipy
 from ...util.general import samples_multidimensional_uniform
 import numpy as np
 
@@ -28,8 +27,10 @@ class LocalPenalization(EvaluatorBase):
 
         self.acquisition.update_batches(None,None,None)
 
-        # --- GET first element in the batch
-        X_batch = self.acquisition.optimize()[0]
+        # --- GET first element in the batch (the batch is pre-allocated and filled row by row)
+        x_first = self.acquisition.optimize()[0]
+        X_batch = np.empty((self.batch_size, x_first.shape[1]))
+        X_batch[0] = x_first
         k=1
 
         if self.batch_size >1:
@@ -39,9 +40,8 @@ class LocalPenalization(EvaluatorBase):
 
         # --- GET the remaining elements
         while k<self.batch_size:
-            self.acquisition.update_batches(X_batch,L,Min)
-            new_sample = self.acquisition.optimize()[0]
-            X_batch = np.vstack((X_batch,new_sample))
+            self.acquisition.update_batches(X_batch[:k],L,Min)
+            X_batch[k] = self.acquisition.optimize()[0]
             k +=1
 
         # --- Back to the non-penalized acquisition
@@ -51,20 +51,12 @@ class LocalPenalization(EvaluatorBase):
 
 def estimate_L(model,bounds,storehistory=True):
     """
-    Estimate the Lipschitz constant of f by taking maximizing the norm of the expectation of the gradient of *f*.
+    Estimate the Lipschitz constant of f by taking the maximum of the norm of the expectation of the gradient of *f*
+    over a set of random locations and the inputs of the model. The gradients are computed in one single vectorized call.
     """
-    def df(x,model,x0):
-        x = np.atleast_2d(x)
-        dmdx,_ = model.predictive_gradients(x)
-        res = np.sqrt((dmdx*dmdx).sum(1)) # simply take the norm of the expectation of the gradient
-        return -res
-
     samples = samples_multidimensional_uniform(bounds,500)
     samples = np.vstack([samples,model.X])
-    pred_samples = df(samples,model,0)
-    x0 = samples[np.argmin(pred_samples)]
-    res = scipy.optimize.minimize(df,x0, method='L-BFGS-B',bounds=bounds, args = (model,x0), options = {'maxiter': 200})
-    minusL = res.fun[0][0]
-    L = -minusL
+    dmdx,_ = model.predictive_gradients(samples)
+    L = np.linalg.norm(dmdx, axis=1).max() # simply take the norm of the expectation of the gradient
     if L<1e-7: L=10  ## to avoid problems in cases in which the model is flat.
     return L
@@ -67,6 +67,7 @@ class BayesianOptimization(BO):
     :param verbosity: prints the models and other options during the optimization (default, False).
     :param maximize: when True -f maximization of f is done by minimizing -f (default, False).
     :param **kwargs: extra parameters. Can be used to tune the current optimization setup or to use deprecated options in this package release.
+        - 'acquisition_optimizer_num_cores': processes used to optimize the acquisition, -1 for all the cores (default, 1). See AcquisitionOptimizer.
 
 
     .. Note::   The parameters bounds, kernel, numdata_initial_design, type_initial_design, model_optimize_interval, acquisition, acquisition_par
@@ -138,7 +139,11 @@ class BayesianOptimization(BO):
 
         # This states how the discrete variables are handled (exact search or rounding)
         self.acquisition_optimizer_type = acquisition_optimizer_type
-        self.acquisition_optimizer = AcquisitionOptimizer(self.space, self.acquisition_optimizer_type, model=self.model)  ## more arguments may come here
+        if 'acquisition_optimizer_num_cores' in kwargs:
+            self.acquisition_optimizer_num_cores = kwargs['acquisition_optimizer_num_cores']
+        else:
+            self.acquisition_optimizer_num_cores = 1
+        self.acquisition_optimizer = AcquisitionOptimizer(self.space, self.acquisition_optimizer_type, model=self.model, num_cores=self.acquisition_optimizer_num_cores)  ## more arguments may come here
 
         # --- CHOOSE acquisition function. If an instance of an acquisition is passed (possibly user defined), it is used.
         self.acquisition_type = acquisition_type
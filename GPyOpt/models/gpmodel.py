@@ -40,6 +40,7 @@ class GPModel(BOModel):
         self.num_inducing = num_inducing
         self.model = None
         self.ARD = ARD
+        self._fmin = None
 
     @staticmethod
     def fromConfig(config):
@@ -90,6 +91,9 @@ class GPModel(BOModel):
             else:
                 self.model.optimize_restarts(num_restarts=self.optimize_restarts, optimizer=self.optimizer, max_iters = self.max_iters, verbose=self.verbose)
 
+        # --- the posterior has changed, so the cached minimum of the mean is no longer valid.
+        self._fmin = None
+
     def _predict(self, X, full_cov, include_likelihood):
         if X.ndim == 1:
             X = X[None,:]
@@ -123,8 +127,13 @@ class GPModel(BOModel):
     def get_fmin(self):
         """
         Returns the location where the posterior mean is takes its minimal value.
+
+        .. Note:: the value only changes when the model is updated, so it is computed once and cached. Otherwise every
+        evaluation of the acquisition (e.g. EI or MPI) would predict again at all the training locations.
         """
-        return self.model.predict(self.model.X)[0].min()
+        if self._fmin is None:
+            self._fmin = self.model.predict(self.model.X)[0].min()
+        return self._fmin
 
     def predict_withGradients(self, X):
         """
@@ -142,6 +151,8 @@ class GPModel(BOModel):
     def copy(self):
         """
         Makes a safe copy of the model.
+
+        .. Note:: the fitted hyper-parameters (noise included) are copied over, so the GP is not trained again.
         """
         copied_model = GPModel(kernel = self.model.kern.copy(),
                             noise_var=self.noise_var,
@@ -149,11 +160,14 @@ class GPModel(BOModel):
                             optimizer=self.optimizer,
                             max_iters=self.max_iters,
                             optimize_restarts=self.optimize_restarts,
+                            sparse=self.sparse,
+                            num_inducing=self.num_inducing,
                             verbose=self.verbose,
                             ARD=self.ARD)
 
         copied_model._create_model(self.model.X,self.model.Y)
-        copied_model.updateModel(self.model.X,self.model.Y, None, None)
+        copied_model.model.param_array[:] = self.model.param_array
+        copied_model.model._trigger_params_changed()
         return copied_model
 
     def get_model_parameters(self):
@@ -66,6 +66,7 @@ class InputWarpedGPModel(GPModel):
         self.verbose = verbose
         self.model = None
         self.ARD = ARD
+        self._fmin = None
 
     def _create_model(self, X, Y):
         # --- define kernel
@@ -4,6 +4,7 @@
 from .optimizer import OptLbfgs, OptDirect, OptCma, apply_optimizer, choose_optimizer
 from .anchor_points_generator import ObjectiveAnchorPointsGenerator, ThompsonSamplingAnchorPointsGenerator
 from ..core.task.space import Design_space
+from ..util.general import spawn_with_errors
 import numpy as np
 
 
@@ -22,6 +23,10 @@ class AcquisitionOptimizer(object):
         - 'lbfgs': L-BFGS.
         - 'DIRECT': Dividing Rectangles.
         - 'CMA': covariance matrix adaptation.
+    :param num_cores: number of processes used to run the local optimizers from the anchor points, -1 to use all the cores (default, 1).
+        The processes are forked at every call to optimize, so this only pays off when the acquisition is expensive. It requires
+        the 'fork' start method of multiprocessing (not available on Windows). If the parallel optimization fails once, the
+        optimizer falls back to a single process from then on.
     """
 
     def __init__(self, space, optimizer='lbfgs', **kwargs):
@@ -34,6 +39,17 @@ class AcquisitionOptimizer(object):
         if 'model' in self.kwargs:
             self.model = self.kwargs['model']
 
+        if 'num_cores' in self.kwargs:
+            self.num_cores = self.kwargs['num_cores']
+        else:
+            self.num_cores = 1
+        if self.num_cores == -1:
+            from multiprocessing import cpu_count
+            self.num_cores = cpu_count()
+        elif self.num_cores < 1:
+            raise ValueError('num_cores must be a positive integer or -1 (all the cores), got ' + str(self.num_cores))
+        self._parallel_failed = False
+
         if 'anchor_points_logic' in self.kwargs:
             self.type_anchor_points_logic = self.kwargs['type_anchor_points_logic']
         else:
@@ -69,13 +85,53 @@ class AcquisitionOptimizer(object):
         anchor_points = anchor_points_generator.get(duplicate_manager=duplicate_manager, context_manager=self.context_manager)
 
         ## --- Applying local optimizers at the anchor points and update bounds of the optimizer (according to the context)
-        optimized_points = [apply_optimizer(self.optimizer, a, f=f, df=None, f_df=f_df, duplicate_manager=duplicate_manager, context_manager=self.context_manager, space = self.space) for a in anchor_points]
+        if self.num_cores == 1 or self._parallel_failed:
+            optimized_points = self._optimize_anchor_points(anchor_points, duplicate_manager)
+        else:
+            try:
+                optimized_points = self._parallel_optimize_anchor_points(anchor_points, duplicate_manager)
+            except Exception as e:
+                print('Error in parallel computation (' + str(e) + '). Fall back to single process!')
+                self._parallel_failed = True
+                optimized_points = self._optimize_anchor_points(anchor_points, duplicate_manager)
         x_min, fx_min = min(optimized_points, key=lambda t:t[1])
 
         #x_min, fx_min = min([apply_optimizer(self.optimizer, a, f=f, df=None, f_df=f_df, duplicate_manager=duplicate_manager, context_manager=self.context_manager, space = self.space) for a in anchor_points], key=lambda t:t[1])
 
         return x_min, fx_min
 
+    def _optimize_anchor_points(self, anchor_points, duplicate_manager=None):
+        """
+        Runs the local optimizer from each of the anchor points in turn.
+        """
+        return [apply_optimizer(self.optimizer, a, f=self.f, df=None, f_df=self.f_df, duplicate_manager=duplicate_manager, context_manager=self.context_manager, space = self.space) for a in anchor_points]
+
+    def _parallel_optimize_anchor_points(self, anchor_points, duplicate_manager=None):
+        """
+        Runs the local optimizers from the anchor points in parallel. The restarts are independent, so the anchor
+        points are divided between the available cores. The workers are forked, since they run a closure over self.
+        """
+        import multiprocessing
+        context = multiprocessing.get_context('fork')
+
+        n_procs = min(self.num_cores, anchor_points.shape[0])
+        divided_anchor_points = [anchor_points[i::n_procs] for i in range(n_procs)]
+        pipe = [context.Pipe(duplex=False) for i in range(n_procs)]
+        proc = [context.Process(target=spawn_with_errors(lambda a: self._optimize_anchor_points(a, duplicate_manager)),args=(c,k)) for k,(p,c) in zip(divided_anchor_points,pipe)]
+        [p.start() for p in proc]
+
+        ### --- Close the parent copies of the sending ends so that recv raises EOFError if a worker dies without answering
+        [c.close() for (p,c) in pipe]
+        try:
+            results = [p.recv() for (p,c) in pipe]
+        finally:
+            [p.join() for p in proc]
+
+        errors = [result for (succeeded, result) in results if not succeeded]
+        if len(errors) > 0:
+            raise RuntimeError('Error in the optimization of the anchor points: ' + errors[0])
+        return [point for (succeeded, result) in results for point in result]
+
 
 class ContextManager(object):
     """
@@ -111,6 +167,10 @@ class ContextManager(object):
             ## update non context index in objective
             self.nocontext_index_obj = [idx for idx in self.all_index_obj if idx not in self.context_index_obj]
 
+        ## --- Index arrays used to expand the vectors, built once since _expand_vector is called in every evaluation
+        self._noncontext_index_array = np.array(self.noncontext_index).astype(int)
+        self._context_index_array = np.array(self.context_index).astype(int)
+
 
 
     def _expand_vector(self,x):
@@ -120,6 +180,6 @@ class ContextManager(object):
         '''
         x = np.atleast_2d(x)
         x_expanded = np.zeros((x.shape[0],self.space.model_dimensionality))
-        x_expanded[:,np.array(self.noncontext_index).astype(int)]  = x
-        x_expanded[:,np.array(self.context_index).astype(int)]  = self.context_value
+        x_expanded[:,self._noncontext_index_array]  = x
+        x_expanded[:,self._context_index_array]  = self.context_value
         return x_expanded
@@ -79,7 +79,8 @@ class ThompsonSamplingAnchorPointsGenerator(AnchorPointsGenerator):
 
         posterior_means, posterior_stds = self.model.predict(X)
 
-        return np.array([np.random.normal(m, s) for m, s in zip(posterior_means, posterior_stds)]).flatten()
+        # A single vectorized draw over all the candidates (same random stream as sampling them one by one)
+        return np.random.normal(posterior_means, posterior_stds).flatten()
 
 
 class ObjectiveAnchorPointsGenerator(AnchorPointsGenerator):
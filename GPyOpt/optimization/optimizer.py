@@ -41,10 +41,12 @@ class OptLbfgs(Optimizer):
         :param f_df: returns both the function to optimize and its gradient.
         """
         import scipy.optimize
-        if f_df is None and df is not None: f_df = lambda x: float(f(x)), df(x)
+        if f_df is None and df is not None: f_df = lambda x: (float(f(x)), df(x))
         if f_df is not None:
+            ### --- f_df already returns the value of the function: evaluating f again would double the cost of every iteration
             def _f_df(x):
-                return f(x), f_df(x)[1][0]
+                fx, dfx = f_df(x)
+                return np.atleast_1d(fx).flatten()[0], dfx[0]
         if f_df is None and df is None:
             res = scipy.optimize.fmin_l_bfgs_b(f, x0=x0, bounds=self.bounds,approx_grad=True, maxiter=self.maxiter)
         else:
@@ -156,7 +158,7 @@ def apply_optimizer(optimizer, x0, f=None, df=None, f_df=None, duplicate_manager
         raise ValueError("The starting point of the optimizer cannot be a duplicate.")
 
     ## --- Optimize point
-    optimized_x, _ = optimizer.optimize(problem.x0_nocontext, problem.f_nocontext, problem.df_nocontext, problem.f_df_nocontext)
+    optimized_x, optimized_fx = optimizer.optimize(problem.x0_nocontext, problem.f_nocontext, problem.df_nocontext, problem.f_df_nocontext)
 
     ## --- Add context and round according to the type of variables of the design space
     suggested_x_with_context = add_context(optimized_x)
@@ -165,6 +167,9 @@ def apply_optimizer(optimizer, x0, f=None, df=None, f_df=None, duplicate_manager
     ## --- Run duplicate_manager
     if duplicate_manager and duplicate_manager.is_unzipped_x_duplicate(suggested_x_with_context_rounded):
         suggested_x, suggested_fx = x0, np.atleast_2d(f(x0))
+    elif np.array_equal(suggested_x_with_context_rounded, suggested_x_with_context):
+        ## --- The rounding did not move the optimum, so the value returned by the optimizer can be reused
+        suggested_x, suggested_fx = suggested_x_with_context_rounded, np.atleast_2d(optimized_fx)
     else:
         suggested_x, suggested_fx = suggested_x_with_context_rounded, f(suggested_x_with_context_rounded)
 
@@ -220,7 +225,7 @@ class OptimizationWithContext(object):
         x = np.atleast_2d(x)
         xx = self.context_manager._expand_vector(x)
         _, df_nocontext_xx = self.f_df(xx)
-        df_nocontext_xx = df_nocontext_xx[:,np.array(self.context_manager.noncontext_index)]
+        df_nocontext_xx = df_nocontext_xx[:,self.context_manager._noncontext_index_array]
         return df_nocontext_xx
 
     def f_df_nc(self,x):
@@ -231,7 +236,7 @@ class OptimizationWithContext(object):
         x = np.atleast_2d(x)
         xx = self.context_manager._expand_vector(x)
         f_nocontext_xx , df_nocontext_xx = self.f_df(xx)
-        df_nocontext_xx = df_nocontext_xx[:,np.array(self.context_manager.noncontext_index)]
+        df_nocontext_xx = df_nocontext_xx[:,self.context_manager._noncontext_index_array]
         return f_nocontext_xx, df_nocontext_xx
 
 
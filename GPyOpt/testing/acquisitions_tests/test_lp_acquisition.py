@@ -0,0 +1,29 @@
+import unittest
+from mock import Mock
+
+import numpy as np
+from scipy.special import log_ndtr
+
+from GPyOpt.acquisitions import AcquisitionEI, AcquisitionLP
+from GPyOpt.core.task.space import Design_space
+
+class TestLPAcquisition(unittest.TestCase):
+    def setUp(self):
+        self.mock_model = Mock()
+        self.mock_optimizer = Mock()
+        domain = [{'name': 'var_1', 'type': 'continuous', 'domain': (1e7-1,1e7+1), 'dimensionality': 2}]
+        self.space = Design_space(domain, None)
+
+        acquisition = AcquisitionEI(self.mock_model, self.space, self.mock_optimizer)
+        self.lp_acquisition = AcquisitionLP(self.mock_model, self.space, self.mock_optimizer, acquisition)
+
+    def test_hammer_function_offset_domain(self):
+        # the distances to the penalizers must stay exact when the domain is far from the origin
+        x0 = 1e7 + np.array([[0., 0.], [1e-3, -2e-3]])
+        x = 1e7 + np.array([[1e-3, 1e-3]])
+        r_x0, s_x0 = np.array([1e-3, 2e-3]), np.array([1e-3, 1e-3])
+
+        hammer_values = self.lp_acquisition._hammer_function(x, x0, r_x0, s_x0)
+        expected_values = log_ndtr((np.linalg.norm(x - x0, axis=1) - r_x0)/s_x0)
+
+        self.assertTrue(np.allclose(expected_values, hammer_values[0], rtol=1e-6))
@@ -40,6 +40,39 @@ class TestModels(unittest.TestCase):
 
         assert_allclose(v, mock_variance, atol=1e-5)
 
+    def test_gpmodel_get_fmin_is_cached(self):
+        model = GPModel(optimize_restarts=1, max_iters=0, verbose=False)
+        np.random.seed(0)
+        X = np.random.randn(10, 2)
+        Y = np.sum(np.sin(X), 1).reshape(10, 1)
+        model.updateModel(X, Y, None, None)
+
+        fmin = model.get_fmin()
+        self.assertEqual(fmin, model.model.predict(model.model.X)[0].min())
+
+        gp = model.model
+        model.model = Mock(wraps=gp)
+        self.assertEqual(model.get_fmin(), fmin)
+        model.model.predict.assert_not_called()
+        model.model = gp
+
+        model.updateModel(X[:5], Y[:5], None, None)
+        assert_allclose(model.get_fmin(), model.model.predict(X[:5])[0].min())
+
+    def test_gpmodel_copy(self):
+        model = GPModel(optimize_restarts=1, max_iters=10, verbose=False)
+        np.random.seed(0)
+        X = np.random.randn(10, 2)
+        Y = np.sum(np.sin(X), 1).reshape(10, 1)
+        model.updateModel(X, Y, None, None)
+
+        copied_model = model.copy()
+
+        assert_allclose(copied_model.get_model_parameters(), model.get_model_parameters())
+        X_test = np.random.randn(5, 2)
+        for copied, original in zip(copied_model.predict(X_test), model.predict(X_test)):
+            assert_allclose(copied, original)
+
     def test_input_warping_indices(self):
         config1 = [{'name': 'var_1', 'type': 'continuous', 'domain':(-3,1), 'dimensionality': 2},
                   {'name': 'var_2', 'type': 'continuous', 'domain':(-3,1), 'dimensionality': 1}]
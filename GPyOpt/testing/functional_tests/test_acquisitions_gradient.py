@@ -8,7 +8,8 @@ from GPy.models.gradient_checker import GradientChecker
 
 import GPyOpt
 from GPyOpt.util.general import samples_multidimensional_uniform
-from GPyOpt.acquisitions import AcquisitionEI, AcquisitionMPI, AcquisitionLCB
+from GPyOpt.acquisitions import AcquisitionEI, AcquisitionMPI, AcquisitionLCB, AcquisitionLP
+from GPyOpt.models import GPModel
 
 from mock import Mock
 import unittest
@@ -42,6 +43,7 @@ class TestAcquisitionsGradients(unittest.TestCase):
         X = samples_multidimensional_uniform(objective.bounds,n_inital_design)
         Y = objective.f(X)
         self.X_test = samples_multidimensional_uniform(objective.bounds,n_inital_design)
+        self.X, self.Y = X, Y
 
         self.model = Mock()
         self.model.get_fmin.return_value = 0.0
@@ -64,6 +66,34 @@ class TestAcquisitionsGradients(unittest.TestCase):
         grad_lcb = GradientChecker(acquisition_lcb.acquisition_function, acquisition_lcb.d_acquisition_function, self.X_test)
         self.assertTrue(grad_lcb.checkgrad(tolerance=self.tolerance))
 
+    def test_ChecKGrads_LP(self):
+        model = GPModel(optimize_restarts=1, max_iters=0, verbose=False)
+        model.updateModel(self.X, self.Y, None, None)
+        X_batch = self.X_test[:2]
+        for acquisition in [AcquisitionEI(model, self.feasible_region), AcquisitionLCB(model, self.feasible_region)]:
+            acquisition_lp = AcquisitionLP(model, self.feasible_region, None, acquisition)
+            acquisition_lp.update_batches(X_batch, 10., self.Y.min())
+            # the gradient check is done point by point, away from the centers of the penalizers
+            for x in self.X_test[2:]:
+                grad_lp = GradientChecker(acquisition_lp.acquisition_function, acquisition_lp.d_acquisition_function, x[None,:])
+                self.assertTrue(grad_lp.checkgrad(tolerance=self.tolerance))
+
+    def test_ChecKGrads_LP_multidimensional(self):
+        # in more than one dimension the gradient of the penalizers depends on the direction (x-x0)/|x-x0|
+        bounds = [(-2,2)]*3
+        feasible_region = GPyOpt.Design_space(space = [{'name': 'var_1', 'type': 'continuous', 'domain': (-2,2), 'dimensionality': 3}])
+        X = samples_multidimensional_uniform(bounds,10)
+        Y = np.sum(np.sin(X), 1).reshape(10, 1)
+        X_test = samples_multidimensional_uniform(bounds,8)
+        model = GPModel(optimize_restarts=1, max_iters=0, verbose=False)
+        model.updateModel(X, Y, None, None)
+        X_batch = X_test[:3]
+        for acquisition in [AcquisitionEI(model, feasible_region), AcquisitionLCB(model, feasible_region)]:
+            acquisition_lp = AcquisitionLP(model, feasible_region, None, acquisition)
+            acquisition_lp.update_batches(X_batch, 2., Y.min())
+            for x in X_test[3:]:
+                grad_lp = GradientChecker(acquisition_lp.acquisition_function, acquisition_lp.d_acquisition_function, x[None,:])
+                self.assertTrue(grad_lp.checkgrad(tolerance=self.tolerance))
 
 if __name__=='main':
     unittest.main()
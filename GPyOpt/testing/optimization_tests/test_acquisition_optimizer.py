@@ -0,0 +1,71 @@
+import os
+import multiprocessing
+import numpy as np
+import unittest
+from mock import patch
+
+from GPyOpt.core.task.space import Design_space
+from GPyOpt.optimization.acquisition_optimizer import AcquisitionOptimizer
+from GPyOpt.optimization.optimizer import choose_optimizer
+
+fork_available = 'fork' in multiprocessing.get_all_start_methods()
+
+class TestAcquisitionOptimizer(unittest.TestCase):
+    def setUp(self):
+        self.space = Design_space([
+            {'name': 'var_1', 'type': 'continuous', 'domain': (-3, 3), 'dimensionality': 2}
+        ])
+        self.f = lambda x: np.atleast_2d(np.sum(np.sin(x) + 0.1*np.square(x), 1)).T
+        np.random.seed(1)
+        self.anchor_points = self.space.get_bounds()[0][0] + 6*np.random.rand(5, 2)
+
+    def _acquisition_optimizer(self, f):
+        acquisition_optimizer = AcquisitionOptimizer(self.space, num_cores=2)
+        acquisition_optimizer.f = f
+        acquisition_optimizer.f_df = None
+        acquisition_optimizer.optimizer = choose_optimizer('lbfgs', acquisition_optimizer.context_manager.noncontext_bounds)
+        return acquisition_optimizer
+
+    def test_num_cores(self):
+        self.assertEqual(AcquisitionOptimizer(self.space, num_cores=-1).num_cores, multiprocessing.cpu_count())
+        for num_cores in [0, -2]:
+            with self.assertRaises(ValueError):
+                AcquisitionOptimizer(self.space, num_cores=num_cores)
+
+    @unittest.skipUnless(fork_available, 'the parallel optimization needs the fork start method')
+    def test_parallel_optimization_matches_sequential(self):
+        acquisition_optimizer = self._acquisition_optimizer(self.f)
+
+        points_seq = acquisition_optimizer._optimize_anchor_points(self.anchor_points)
+        points_par = acquisition_optimizer._parallel_optimize_anchor_points(self.anchor_points)
+
+        # the anchor points are split between the processes, so compare the results as sets
+        key = lambda t: t[1].item()
+        for (x_par, fx_par), (x_seq, fx_seq) in zip(sorted(points_par, key=key), sorted(points_seq, key=key)):
+            np.testing.assert_allclose(x_par, x_seq)
+            np.testing.assert_allclose(fx_par, fx_seq)
+
+    @unittest.skipUnless(fork_available, 'the parallel optimization needs the fork start method')
+    def test_parallel_optimization_worker_error(self):
+        parent_pid = os.getpid()
+        def f(x):
+            if os.getpid() != parent_pid:
+                raise ValueError('error in the worker')
+            return self.f(x)
+        acquisition_optimizer = self._acquisition_optimizer(f)
+
+        with self.assertRaises(RuntimeError):
+            acquisition_optimizer._parallel_optimize_anchor_points(self.anchor_points)
+
+        # optimize falls back to a single process
+        np.random.seed(1)
+        x_min, fx_min = acquisition_optimizer.optimize(f=f)
+        np.random.seed(1)
+        x_seq, fx_seq = AcquisitionOptimizer(self.space).optimize(f=self.f)
+        np.testing.assert_allclose(x_min, x_seq)
+        np.testing.assert_allclose(fx_min, fx_seq)
+
+        # and does not try the parallel optimization again
+        with patch.object(acquisition_optimizer, '_parallel_optimize_anchor_points') as parallel_optimize:
+            acquisition_optimizer.optimize(f=f)
+        parallel_optimize.assert_not_called()
@@ -0,0 +1,22 @@
+import numpy as np
+import unittest
+
+from GPyOpt.util import epmgp
+
+
+class TestJointMin(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        A = np.random.randn(4, 4)
+        self.var = np.dot(A, A.T) + np.eye(4)
+        self.mu = np.random.randn(4)
+
+    def test_joint_min_column_mean(self):
+        logP, dlogPdMu, dlogPdSigma, dlogPdMudMu = epmgp.joint_min(self.mu, self.var, with_derivatives=True)
+        logP_col, dlogPdMu_col, dlogPdSigma_col, dlogPdMudMu_col = epmgp.joint_min(self.mu[:,None], self.var, with_derivatives=True)
+
+        np.testing.assert_allclose(logP_col, logP)
+        np.testing.assert_allclose(dlogPdMu_col, dlogPdMu)
+        np.testing.assert_allclose(dlogPdSigma_col, dlogPdSigma)
+        np.testing.assert_allclose(dlogPdMudMu_col, dlogPdMudMu)
+        self.assertAlmostEqual(np.exp(logP).sum(), 1.)
@@ -7,7 +7,7 @@ from numpy.testing import assert_allclose
 from GPyOpt.core.errors import InvalidConfigError
 from GPyOpt.core.task.space import Design_space
 from GPyOpt.experiment_design import initial_design
-from GPyOpt.util.general import normalize
+from GPyOpt.util.general import normalize, best_value
 
 
 class TestInitialDesign(unittest.TestCase):
@@ -169,3 +169,17 @@ class TestNormalization(unittest.TestCase):
         y = np.arange(5)
         y_norm = normalize(y - 1, 'maxmin')
         assert_allclose(y_norm, (y - 2) / 2)
+
+
+class TestBestValue(unittest.TestCase):
+    """Test the best_value function."""
+    def test_best_value(self):
+        Y = np.array([[3.], [1.], [2.], [0.5], [4.]])
+        assert_allclose(best_value(Y), [3., 1., 1., 0.5, 0.5])
+        assert_allclose(best_value(Y, sign=-1), [3., 3., 3., 3., 4.])
+
+    def test_best_value_matches_running_extrema(self):
+        np.random.seed(0)
+        Y = np.random.randn(50, 1)
+        assert_allclose(best_value(Y), [Y[:(i+1)].min() for i in range(50)])
+        assert_allclose(best_value(Y, sign=-1), [Y[:(i+1)].max() for i in range(50)])
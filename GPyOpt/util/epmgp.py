@@ -41,7 +41,7 @@ https://github.com/ProbabilisticNumerics/entropy-search
 
 
 import numpy as np
-from scipy import special
+from scipy import linalg, special
 
 # some variables
 sq2 = np.sqrt(2)
@@ -72,6 +72,7 @@ def joint_min(mu, var, with_derivatives=False, **kwargs):
         pmin distribution
     """
 
+    mu = np.ravel(mu)
     logP = np.zeros(mu.shape)
     D = mu.shape[0]
     if with_derivatives:
@@ -132,7 +133,7 @@ def min_faktor(Mu, Sigma, k, gamma=1):
     M = np.copy(Mu)
     V = np.copy(Sigma)
     b = False
-    d = np.NaN
+    d = np.nan
     for count in range(50):
         diff = 0
         for i in range(D - 1):
@@ -152,7 +153,7 @@ def min_faktor(Mu, Sigma, k, gamma=1):
             b = True
             break
     if np.isnan(d):
-        logZ = -np.Infinity
+        logZ = -np.inf
         yield logZ
         dlogZdMu = np.zeros((D, 1))
         yield dlogZdMu
@@ -165,9 +166,12 @@ def min_faktor(Mu, Sigma, k, gamma=1):
         yield mvmin
     else:
         # evaluate log Z:
-        C = np.eye(D) / sq2
+        # identity without its k-th column (built directly, as for l in the
+        # loop above) and with the k-th row set to -1/sqrt(2)
+        C = np.zeros((D, D - 1))
+        cols = np.arange(D - 1)
+        C[cols + (cols >= k), cols] = 1 / sq2
         C[k, :] = -1 / sq2
-        C = np.delete(C, k, 1)
 
         R = np.sqrt(P.T) * C
         r = np.sum(MP.T * C, 1)
@@ -178,11 +182,8 @@ def min_faktor(Mu, Sigma, k, gamma=1):
         s = sum(logS)
         IRSR = (np.eye(D - 1) + np.dot(np.dot(R.T, Sigma), R))
         rSr = np.dot(np.dot(r.T, Sigma), r)
-        A = np.dot(R, np.linalg.solve(IRSR, R.T))
-
-        A = 0.5 * (A.T + A)  # ensure symmetry.
-        b = (Mu + np.dot(Sigma, r))
-        Ab = np.dot(A, b)
+        # IRSR is symmetric positive definite: factorize it once and reuse the
+        # Cholesky factor for both the solve and the log-determinant.
         try:
             cIRSR = np.linalg.cholesky(IRSR)
         except np.linalg.LinAlgError:
@@ -190,6 +191,11 @@ def min_faktor(Mu, Sigma, k, gamma=1):
                 cIRSR = np.linalg.cholesky(IRSR + 1e-10 * np.eye(IRSR.shape[0]))
             except np.linalg.LinAlgError:
                 cIRSR = np.linalg.cholesky(IRSR + 1e-6 * np.eye(IRSR.shape[0]))
+        A = np.dot(R, linalg.cho_solve((cIRSR, True), R.T))
+
+        A = 0.5 * (A.T + A)  # ensure symmetry.
+        b = (Mu + np.dot(Sigma, r))
+        Ab = np.dot(A, b)
         dts = 2 * np.sum(np.log(np.diagonal(cIRSR)))
         logZ = 0.5 * (rSr - np.dot(b.T, Ab) - dts) + np.dot(Mu.T, r) + s - 0.5 * mpm
         yield logZ
@@ -213,7 +219,7 @@ def lt_factor(s, l, M, V, mp, p, gamma):
     cVc = (V[l, l] - 2 * V[s, l] + V[s, s]) / 2.0
     Vc = (V[:, l] - V[:, s]) / sq2
     cM = (M[l] - M[s]) / sq2
-    cVnic = np.max([cVc / (1 - p * cVc), 0])
+    cVnic = max(float(cVc / (1 - p * cVc)), 0.)
     cmni = cM + cVnic * (p * cM - mp)
     z = cmni / np.sqrt(cVnic + 1e-25)
     if np.isnan(z):
@@ -230,9 +236,9 @@ def lt_factor(s, l, M, V, mp, p, gamma):
         mpnew = r * (alpha + cmni / cVnic) + alpha
 
         # update terms
-        dp = np.max([-p + eps, gamma * (pnew - p)])  # at worst, remove message
-        dmp = np.max([-mp + eps, gamma * (mpnew - mp)])
-        d = np.max([dmp, dp])  # for convergence measures
+        dp = max(float(-p + eps), float(gamma * (pnew - p)))  # at worst, remove message
+        dmp = max(float(-mp + eps), float(gamma * (mpnew - mp)))
+        d = max(dmp, dp)  # for convergence measures
 
         pnew = p + dp
         mpnew = mp + dmp
@@ -249,12 +255,12 @@ def lt_factor(s, l, M, V, mp, p, gamma):
              + (alpha * alpha) / (2 * beta) * cVnic
 
     elif exit_flag == -1:
-        d = np.NAN
+        d = np.nan
         Mnew = 0
         Vnew = 0
         pnew = 0
         mpnew = 0
-        logS = -np.Infinity
+        logS = -np.inf
     elif exit_flag == 1:
         d = 0
         # remove message from marginal:
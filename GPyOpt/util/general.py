@@ -133,12 +133,11 @@ def best_value(Y,sign=1):
     Returns a vector whose components i are the minimum (default) or maximum of Y[:i]
     '''
     n = Y.shape[0]
-    Y_best = np.ones(n)
-    for i in range(n):
-        if sign == 1:
-            Y_best[i]=Y[:(i+1)].min()
-        else:
-            Y_best[i]=Y[:(i+1)].max()
+    Y = np.asarray(Y, dtype=float).reshape(n, -1)
+    if sign == 1:
+        Y_best = np.minimum.accumulate(Y.min(axis=1))
+    else:
+        Y_best = np.maximum.accumulate(Y.max(axis=1))
     return Y_best
 
 def spawn(f):
@@ -150,6 +149,18 @@ def spawn(f):
         pipe.close()
     return fun
 
+def spawn_with_errors(f):
+    '''
+    Same as spawn, but the process always answers: it sends (True, f(x)) or (False, description of the error raised by f)
+    '''
+    def fun(pipe,x):
+        try:
+            pipe.send((True, f(x)))
+        except Exception as e:
+            pipe.send((False, repr(e)))
+        pipe.close()
+    return fun
+
 
 def evaluate_function(f,X):
     '''